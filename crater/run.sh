@@ -1,5 +1,6 @@
 #!/usr/bin/with-contenv bashio
 
-id
+echo "Starting nginx..."
 nginx
-php-fpm
\ No newline at end of file
+echo "Starting php-fpm..."
+exec php-fpm
\ No newline at end of file